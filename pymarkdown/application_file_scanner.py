@@ -139,21 +139,80 @@ class ApplicationFileScanner:
         normalized_next_path = (
             next_path.replace(os.altsep, os.sep) if os.altsep else next_path
         )
-        for root, _, files in os.walk(normalized_next_path):
-            normalized_root = root.replace(os.altsep, os.sep) if os.altsep else root
-            if not recurse_directories and normalized_root != normalized_next_path:
-                continue
-            normalized_root = (
-                normalized_root[:-1]
-                if normalized_root.endswith(os.sep)
-                else normalized_root
+        ApplicationFileScanner.__process_directory_entries(
+            normalized_next_path,
+            files_to_parse,
+            recurse_directories,
+            eligible_extensions,
+        )
+
+    @staticmethod
+    def __process_directory_entries(
+        directory_path: str,
+        files_to_parse: Set[str],
+        recurse_directories: bool,
+        eligible_extensions: List[str],
+    ) -> None:
+        """
+        Use os.scandir to walk the directory, as the file type information it
+        returns allows most entries to be classified without an extra stat call.
+        As with os.walk, any directory that cannot be listed is silently skipped.
+        """
+        try:
+            with os.scandir(directory_path) as directory_iterator:
+                directory_entries = [
+                    ApplicationFileScanner.__classify_directory_entry(next_entry)
+                    for next_entry in directory_iterator
+                ]
+        except OSError as this_exception:
+            LOGGER.debug(
+                "Directory '%s' cannot be listed (%s). Skipping.",
+                directory_path,
+                str(this_exception),
             )
-            for file in files:
-                rooted_file_path = f"{normalized_root}{os.sep}{file}"
-                if ApplicationFileScanner.__is_file_eligible_to_scan(
-                    rooted_file_path, eligible_extensions
-                ):
-                    files_to_parse.add(rooted_file_path)
+            return
+
+        normalized_root = (
+            directory_path[:-1] if directory_path.endswith(os.sep) else directory_path
+        )
+        for entry_name, is_directory, is_symlink, is_file in directory_entries:
+            rooted_file_path = f"{normalized_root}{os.sep}{entry_name}"
+            if is_directory:
+                if recurse_directories and not is_symlink:
+                    ApplicationFileScanner.__process_directory_entries(
+                        rooted_file_path,
+                        files_to_parse,
+                        recurse_directories,
+                        eligible_extensions,
+                    )
+            elif is_file and any(
+                entry_name.endswith(next_extension)
+                for next_extension in eligible_extensions
+            ):
+                files_to_parse.add(rooted_file_path)
+
+    @staticmethod
+    def __classify_directory_entry(
+        next_entry: "os.DirEntry[str]",
+    ) -> Tuple[str, bool, bool, bool]:
+        """
+        Snapshot the type information for the entry while the directory is still
+        open, treating an entry whose type cannot be determined as neither a
+        directory nor a file, as os.walk does.
+        """
+        try:
+            is_directory = next_entry.is_dir()
+        except OSError:
+            is_directory = False
+        try:
+            is_symlink = next_entry.is_symlink()
+        except OSError:
+            is_symlink = False
+        try:
+            is_file = not is_directory and next_entry.is_file()
+        except OSError:
+            is_file = False
+        return next_entry.name, is_directory, is_symlink, is_file
 
     @staticmethod
     def __is_file_eligible_to_scan(
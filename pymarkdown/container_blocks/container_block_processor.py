@@ -551,19 +551,17 @@ class ContainerBlockProcessor:
         position_marker: PositionMarker,
         grab_bag: ContainerGrabBag,
     ) -> bool:
+        if not grab_bag.parser_properties.is_pragmas_enabled:
+            return False
         _, pragma_whitespace = ParserHelper.extract_spaces(
             position_marker.text_to_parse, 0
         )
-        return (
-            PragmaExtension.look_for_pragmas(
-                position_marker,
-                position_marker.text_to_parse,
-                grab_bag.container_depth,
-                pragma_whitespace,
-                grab_bag.parser_properties,
-            )
-            if grab_bag.parser_properties.is_pragmas_enabled
-            else False
+        return PragmaExtension.look_for_pragmas(
+            position_marker,
+            position_marker.text_to_parse,
+            grab_bag.container_depth,
+            pragma_whitespace,
+            grab_bag.parser_properties,
         )
 
 
@@ -18,6 +18,7 @@ class ParseBlockPassProperties:
             extension_manager.is_linter_pragmas_enabled,
         )
         self.pragma_lines: Dict[int, str] = {}
+        self.__pragmas_enabled_for_document = self.__pragmas_enabled
 
     @property
     def is_front_matter_enabled(self) -> bool:
@@ -29,6 +30,15 @@ class ParseBlockPassProperties:
     @property
     def is_pragmas_enabled(self) -> bool:
         """
-        Returns whether pragma parsing is enabled.
+        Returns whether pragma parsing is enabled for the current document.
         """
-        return self.__pragmas_enabled
+        return self.__pragmas_enabled_for_document
+
+    def reset_for_new_document(self, may_contain_pragmas: bool) -> None:
+        """
+        Reset the properties that are specific to a single document.
+        """
+        self.pragma_lines = {}
+        self.__pragmas_enabled_for_document = (
+            self.__pragmas_enabled and may_contain_pragmas
+        )
@@ -19,6 +19,7 @@ from pymarkdown.parser_helper import ParserHelper
 from pymarkdown.parser_logger import ParserLogger
 from pymarkdown.plugin_manager.found_plugin import FoundPlugin
 from pymarkdown.position_marker import PositionMarker
+from pymarkdown.source_providers import SourceProvider
 
 POGGER = ParserLogger(logging.getLogger(__name__))
 
@@ -57,6 +58,15 @@ class PragmaExtension(ParserExtension):
         """
         _ = extension_specific_facade
 
+    @staticmethod
+    def may_contain_pragmas(source_provider: SourceProvider) -> bool:
+        """
+        Determine whether the document may contain any pragmas.  As every pragma
+        starts with the pragma prefix, a document without that prefix anywhere can
+        skip looking for pragmas on each line.
+        """
+        return source_provider.is_text_in_remaining_lines(PragmaToken.pragma_prefix)
+
     @staticmethod
     def look_for_pragmas(
         position_marker: PositionMarker,
@@ -69,41 +79,48 @@ class PragmaExtension(ParserExtension):
         Look for a pragma in the current line.
         """
 
-        POGGER.debug("look_for_pragmas - >$<", line_to_parse)
-        POGGER.debug("look_for_pragmas - ws >$<", extracted_whitespace)
+        is_debug_enabled = POGGER.is_debug_enabled
+        if is_debug_enabled:
+            POGGER.debug("look_for_pragmas - >$<", line_to_parse)
+            POGGER.debug("look_for_pragmas - ws >$<", extracted_whitespace)
         if (
-            not container_depth
-            and not extracted_whitespace
-            and (
-                line_to_parse.startswith(PragmaToken.pragma_prefix)
-                or line_to_parse.startswith(PragmaToken.pragma_alternate_prefix)
-            )
+            container_depth
+            or extracted_whitespace
+            or not line_to_parse
+            or line_to_parse[0] != "<"
+            or not line_to_parse.startswith(PragmaToken.pragma_prefix)
         ):
-            was_extended_prefix = line_to_parse.startswith(
-                PragmaToken.pragma_alternate_prefix
-            )
+            if is_debug_enabled:
+                POGGER.debug("pragma not extracted - >$<", line_to_parse)
+            return False
+
+        # The alternate prefix starts with the normal prefix, so it only needs
+        # to be checked once the normal prefix is known to be present.
+        was_extended_prefix = line_to_parse.startswith(
+            PragmaToken.pragma_alternate_prefix
+        )
 
-            start_index, _ = ParserHelper.extract_spaces(
-                line_to_parse,
-                len(
-                    PragmaToken.pragma_alternate_prefix
-                    if was_extended_prefix
-                    else PragmaToken.pragma_prefix
-                ),
+        start_index, _ = ParserHelper.extract_spaces(
+            line_to_parse,
+            PragmaToken.pragma_alternate_prefix_length
+            if was_extended_prefix
+            else PragmaToken.pragma_prefix_length,
+        )
+        remaining_line = line_to_parse[start_index:].rstrip().lower()
+        if remaining_line.startswith(
+            PragmaToken.pragma_title
+        ) and remaining_line.endswith(PragmaToken.pragma_suffix):
+            index_number = (
+                -position_marker.line_number
+                if was_extended_prefix
+                else position_marker.line_number
             )
-            remaining_line = line_to_parse[start_index:].rstrip().lower()
-            if remaining_line.startswith(
-                PragmaToken.pragma_title
-            ) and remaining_line.endswith(PragmaToken.pragma_suffix):
-                index_number = (
-                    -position_marker.line_number
-                    if was_extended_prefix
-                    else position_marker.line_number
-                )
-                parser_properties.pragma_lines[index_number] = line_to_parse
+            parser_properties.pragma_lines[index_number] = line_to_parse
+            if is_debug_enabled:
                 POGGER.debug("pragma $ extracted - >$<", index_number, line_to_parse)
-                return True
-        POGGER.debug("pragma not extracted - >$<", line_to_parse)
+            return True
+        if is_debug_enabled:
+            POGGER.debug("pragma not extracted - >$<", line_to_parse)
         return False
 
     # pylint: disable=too-many-arguments
@@ -120,10 +137,10 @@ class PragmaExtension(ParserExtension):
         Compile a single pragma line, validating it before adding it to the dictionary of pragmas.
         """
         if next_line_number > 0:
-            prefix_length = len(PragmaToken.pragma_prefix)
+            prefix_length = PragmaToken.pragma_prefix_length
             actual_line_number = next_line_number
         else:
-            prefix_length = len(PragmaToken.pragma_alternate_prefix)
+            prefix_length = PragmaToken.pragma_alternate_prefix_length
             actual_line_number = -next_line_number
 
         line_after_prefix = pragma_lines[next_line_number][prefix_length:].rstrip()
@@ -131,7 +148,7 @@ class PragmaExtension(ParserExtension):
         assert after_whitespace_index is not None
         command_data = line_after_prefix[
             after_whitespace_index
-            + len(PragmaToken.pragma_title) : -len(PragmaToken.pragma_suffix)
+            + PragmaToken.pragma_title_length : -PragmaToken.pragma_suffix_length
         ]
         after_command_index, command = ParserHelper.extract_until_spaces(
             command_data, 0
@@ -177,19 +194,27 @@ class PragmaExtension(ParserExtension):
         all_ids: Dict[str, FoundPlugin],
         command: str,
     ) -> None:
-        ids_to_disable = command_data[after_command_index:].split(",")
+        ids_to_disable = [
+            next_id.strip().lower()
+            for next_id in command_data[after_command_index:].split(",")
+        ]
+        unique_ids_to_disable = set(ids_to_disable)
+        if "" not in unique_ids_to_disable and all_ids.keys() >= unique_ids_to_disable:
+            document_pragmas[actual_line_number + 1] = {
+                all_ids[next_id].plugin_id for next_id in unique_ids_to_disable
+            }
+            return
+
         processed_ids = set()
         for next_id in ids_to_disable:
-            next_id = next_id.strip().lower()
             if not next_id:
                 log_pragma_failure(
                     scan_file,
                     actual_line_number,
                     f"Inline configuration command '{command}' specified a plugin with a blank id.",
                 )
-            elif next_id in all_ids:
-                normalized_id = all_ids[next_id].plugin_id
-                processed_ids.add(normalized_id)
+            elif found_plugin := all_ids.get(next_id):
+                processed_ids.add(found_plugin.plugin_id)
             else:
                 log_pragma_failure(
                     scan_file,
@@ -213,12 +238,17 @@ class PragmaToken(MarkdownToken):
     pragma_title = "pyml "
     pragma_suffix = "-->"
 
+    pragma_prefix_length = len(pragma_prefix)
+    pragma_alternate_prefix_length = len(pragma_alternate_prefix)
+    pragma_title_length = len(pragma_title)
+    pragma_suffix_length = len(pragma_suffix)
+
     def __init__(self, pragma_lines: Dict[int, str]) -> None:
         self.__pragma_lines = pragma_lines
 
-        serialized_pragmas = "".join(
-            f";{next_line_number}:{pragma_lines[next_line_number]}"
-            for next_line_number in pragma_lines
+        serialized_pragmas = ";".join(
+            f"{next_line_number}:{next_pragma_line}"
+            for next_line_number, next_pragma_line in pragma_lines.items()
         )
 
         MarkdownToken.__init__(
@@ -226,9 +256,19 @@ class PragmaToken(MarkdownToken):
             MarkdownToken._token_pragma,
             MarkdownTokenClass.SPECIAL,
             is_extension=True,
-            extra_data=serialized_pragmas[1:],
+            extra_data=serialized_pragmas,
         )
 
+    # pylint: disable=protected-access
+    @staticmethod
+    def get_markdown_token_type() -> str:
+        """
+        Get the type of markdown token for rehydration purposes.
+        """
+        return MarkdownToken._token_pragma
+
+    # pylint: enable=protected-access
+
     @property
     def pragma_lines(self) -> Dict[int, str]:
         """
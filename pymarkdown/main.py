@@ -8,7 +8,8 @@ import runpy
 import sys
 import tempfile
 import traceback
-from typing import List, Optional, cast
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Optional, Tuple, cast
 
 from application_properties import ApplicationProperties
 
@@ -24,6 +25,8 @@ from pymarkdown.parser_logger import ParserLogger
 from pymarkdown.plugin_manager.bad_plugin_error import BadPluginError
 from pymarkdown.plugin_manager.plugin_manager import PluginManager
 from pymarkdown.plugin_manager.plugin_scan_context import PluginScanContext
+from pymarkdown.recording_presentation import RecordingPresentation
+from pymarkdown.scan_worker_error import ScanWorkerError
 from pymarkdown.source_providers import FileSourceProvider
 from pymarkdown.tokenized_markdown import TokenizedMarkdown
 
@@ -39,10 +42,22 @@ class PyMarkdownLint:
     """
 
     __default_configuration_file = ".pymarkdown"
+    __plugin_directory = os.path.join(
+        os.path.dirname(os.path.realpath(__file__)), "plugins"
+    )
+
+    # ProcessPoolExecutor does not allow more than 61 worker processes on Windows.
+    __maximum_windows_scan_jobs = 61
 
     __normal_scan_subcommand = "scan"
     __stdin_scan_subcommand = "scan-stdin"
 
+    __argument_parser: Optional[argparse.ArgumentParser] = None
+    __argument_parser_program_name: Optional[str] = None
+
+    __scan_worker: Optional["PyMarkdownLint"] = None
+    __scan_worker_args: Optional[argparse.Namespace] = None
+
     def __init__(
         self,
         presentation: Optional[MainPresentation] = None,
@@ -66,6 +81,7 @@ class PyMarkdownLint:
         self.__tokenizer: Optional[TokenizedMarkdown] = None
         self.__plugins: PluginManager = PluginManager(self.__presentation)
         self.__extensions: ExtensionManager = ExtensionManager(self.__presentation)
+        self.__direct_args: List[str] = []
 
     @property
     def application_version(self) -> str:
@@ -84,7 +100,32 @@ class PyMarkdownLint:
         version_meta = runpy.run_path(file_path)
         return str(version_meta["__version__"])
 
-    def __parse_arguments(self, direct_args: Optional[List[str]]) -> argparse.Namespace:
+    @staticmethod
+    def __job_count_type(argument: str) -> int:
+        if argument.isdigit() and int(argument) > 0:
+            return int(argument)
+        raise argparse.ArgumentTypeError(
+            f"Value '{argument}' is not a positive integer."
+        )
+
+    @staticmethod
+    def __get_argument_parser() -> argparse.ArgumentParser:
+        """
+        Get the argument parser, only building it if it has not been built yet.
+        As argparse uses the program name when the parser is built, the parser is
+        rebuilt if that name changes.
+        """
+        program_name = sys.argv[0] if sys.argv else ""
+        if (
+            PyMarkdownLint.__argument_parser is None
+            or PyMarkdownLint.__argument_parser_program_name != program_name
+        ):
+            PyMarkdownLint.__argument_parser = PyMarkdownLint.__build_argument_parser()
+            PyMarkdownLint.__argument_parser_program_name = program_name
+        return PyMarkdownLint.__argument_parser
+
+    @staticmethod
+    def __build_argument_parser() -> argparse.ArgumentParser:
         parser = argparse.ArgumentParser(description="Lint any found Markdown files.")
 
         parser.add_argument(
@@ -108,21 +149,21 @@ class PyMarkdownLint:
             "-x-scan",
             dest="x_test_scan_fault",
             action="store_true",
-            default="",
+            default=False,
             help=argparse.SUPPRESS,
         )
         parser.add_argument(
             "-x-init",
             dest="x_test_init_fault",
             action="store_true",
-            default="",
+            default=False,
             help=argparse.SUPPRESS,
         )
         parser.add_argument(
             "-x-stdin",
             dest="x_test_stdin_fault",
             action="store_true",
-            default="",
+            default=False,
             help=argparse.SUPPRESS,
         )
 
@@ -155,6 +196,16 @@ class PyMarkdownLint:
         ApplicationFileScanner.add_default_command_line_arguments(
             new_sub_parser, ".md", "Markdown"
         )
+        new_sub_parser.add_argument(
+            "-j",
+            "--jobs",
+            dest="scan_jobs",
+            metavar="JOBS",
+            action="store",
+            default=1,
+            type=PyMarkdownLint.__job_count_type,
+            help="number of processes to use when scanning files (default is 1)",
+        )
 
         subparsers.add_parser(
             PyMarkdownLint.__stdin_scan_subcommand,
@@ -162,7 +213,10 @@ class PyMarkdownLint:
         )
 
         subparsers.add_parser("version", help="version of the application")
+        return parser
 
+    def __parse_arguments(self, direct_args: Optional[List[str]]) -> argparse.Namespace:
+        parser = PyMarkdownLint.__get_argument_parser()
         parse_arguments = parser.parse_args(args=direct_args)
 
         if not parse_arguments.primary_subparser:
@@ -192,8 +246,11 @@ class PyMarkdownLint:
             )
             assert self.__tokenizer
             actual_tokens = self.__tokenizer.transform_from_provider(source_provider)
+            assert source_provider
 
-            self.__process_file_scan(context, next_file, next_file_name, actual_tokens)
+            self.__process_file_scan(
+                context, source_provider, next_file_name, actual_tokens
+            )
 
             context.report_on_triggered_rules()
             POGGER.info("Ending file '$'.", next_file_name)
@@ -205,7 +262,7 @@ class PyMarkdownLint:
     def __process_file_scan(
         self,
         context: PluginScanContext,
-        next_file: str,
+        source_provider: FileSourceProvider,
         next_file_name: str,
         actual_tokens: List[MarkdownToken],
     ) -> None:
@@ -215,31 +272,27 @@ class PyMarkdownLint:
             actual_tokens = actual_tokens[:-1]
 
         POGGER.info("Scanning file '$' tokens.", next_file_name)
+        plugins_next_token = self.__plugins.next_token
         for next_token in actual_tokens:
             POGGER.info("Processing token: $", next_token)
-            self.__plugins.next_token(context, next_token)
+            plugins_next_token(context, next_token)
 
         POGGER.info("Scanning file '$' line-by-line.", next_file_name)
-        source_provider = FileSourceProvider(next_file)
-        line_number, next_line = 1, source_provider.get_next_line()
-        while next_line is not None:
+        lines_to_scan = source_provider.read_lines
+        plugins_next_line = self.__plugins.next_line
+        for line_number, next_line in enumerate(lines_to_scan, 1):
             POGGER.info("Processing line $: $", line_number, next_line)
-            self.__plugins.next_line(context, line_number, next_line)
-            line_number += 1
-            next_line = source_provider.get_next_line()
+            plugins_next_line(context, line_number, next_line)
 
         POGGER.info("Completed scanning file '$'.", next_file_name)
-        self.__plugins.completed_file(context, line_number)
+        self.__plugins.completed_file(context, len(lines_to_scan) + 1)
 
     # pylint: disable=broad-exception-caught
     def __apply_configuration_to_plugins(self) -> None:
         try:
             self.__plugins.apply_configuration(self.__properties)
         except Exception as this_exception:
-            formatted_error = (
-                f"{type(this_exception).__name__} encountered while configuring plugins:\n"
-                + f"{this_exception}"
-            )
+            formatted_error = f"{type(this_exception).__name__} encountered while configuring plugins:\n{this_exception}"
             self.__handle_error(formatted_error, this_exception)
 
     # pylint: enable=broad-exception-caught
@@ -250,10 +303,7 @@ class PyMarkdownLint:
             self.__tokenizer = TokenizedMarkdown(resource_path)
             self.__tokenizer.apply_configuration(self.__properties, self.__extensions)
         except BadTokenizationError as this_exception:
-            formatted_error = (
-                f"{type(this_exception).__name__} encountered while initializing tokenizer:\n"
-                + f"{this_exception}"
-            )
+            formatted_error = f"{type(this_exception).__name__} encountered while initializing tokenizer:\n{this_exception}"
             self.__handle_error(formatted_error, this_exception)
 
     def __initialize_plugin_manager(
@@ -283,27 +333,47 @@ class PyMarkdownLint:
         formatted_error: str,
         thrown_error: Optional[Exception],
         exit_on_error: bool = True,
+        formatted_stack_trace: Optional[str] = None,
     ) -> None:
         LOGGER.warning(formatted_error, exc_info=thrown_error)
 
+        if formatted_stack_trace is None:
+            formatted_stack_trace = (
+                traceback.format_exc()
+                if thrown_error and not isinstance(thrown_error, ValueError)
+                else ""
+            )
         stack_trace = (
-            "\n" + traceback.format_exc()
-            if self.__show_stack_trace
-            and thrown_error
-            and not isinstance(thrown_error, ValueError)
+            f"\n{formatted_stack_trace}"
+            if self.__show_stack_trace and formatted_stack_trace
             else ""
         )
         self.__presentation.print_system_error(f"\n\n{formatted_error}{stack_trace}")
         if exit_on_error:
             sys.exit(1)
 
-    def __handle_scan_error(self, next_file: str, this_exception: Exception) -> None:
+    def __handle_scan_error(
+        self,
+        next_file: str,
+        this_exception: Exception,
+        formatted_stack_trace: Optional[str] = None,
+    ) -> None:
         if formatted_error := self.__presentation.format_scan_error(
             next_file, this_exception
         ):
-            self.__handle_error(formatted_error, this_exception)
+            self.__handle_error(
+                formatted_error,
+                this_exception,
+                formatted_stack_trace=formatted_stack_trace,
+            )
         sys.exit(1)
 
+    @staticmethod
+    def __format_unexpected_error(this_exception: Exception) -> str:
+        if isinstance(this_exception, ValueError):
+            return f"Configuration Error: {this_exception}"
+        return f"Unexpected Error({type(this_exception).__name__}): {this_exception}"
+
     def __handle_file_scanner_output(self, formatted_output: str) -> None:
         self.__presentation.print_system_output(formatted_output)
 
@@ -354,14 +424,153 @@ class PyMarkdownLint:
                     ) from scan_exception
                 except IOError as this_exception:
                     self.__handle_scan_error("stdin", this_exception)
+        elif args.scan_jobs > 1 and len(files_to_scan) > 1:
+            POGGER.debug("Scanning in parallel from: $", files_to_scan)
+            self.__scan_files_in_parallel(args.scan_jobs, files_to_scan)
         else:
             POGGER.debug("Scanning from: $", files_to_scan)
             for next_file in files_to_scan:
                 self.__scan_specific_file(args, next_file, next_file)
 
+    def __scan_files_in_parallel(
+        self, scan_jobs: int, files_to_scan: List[str]
+    ) -> None:
+        """
+        Scan the files using a pool of worker processes, each with its own
+        tokenizer and plugins.  The output from each file is recorded by the
+        worker and replayed here in the same order as a serial scan.
+
+        Files are submitted largest first, so that a large file submitted near
+        the end of the scan does not leave a single worker running by itself.
+        """
+        max_workers = min(scan_jobs, len(files_to_scan))
+        if sys.platform == "win32":
+            max_workers = min(max_workers, PyMarkdownLint.__maximum_windows_scan_jobs)
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=PyMarkdownLint._initialize_scan_worker,
+            initargs=(self.__direct_args,),
+        ) as executor:
+            scan_futures = {
+                next_file: executor.submit(
+                    PyMarkdownLint._scan_file_in_worker, next_file
+                )
+                for next_file in sorted(
+                    files_to_scan, key=os.path.getsize, reverse=True
+                )
+            }
+            try:
+                for next_file in files_to_scan:
+                    (
+                        recorded_calls,
+                        scan_failure_count,
+                        pragma_failure_count,
+                        scan_error,
+                    ) = scan_futures[next_file].result()
+                    RecordingPresentation.replay_recorded_calls(
+                        recorded_calls, self.__presentation
+                    )
+                    self.__plugins.number_of_scan_failures += scan_failure_count
+                    self.__plugins.number_of_pragma_failures += pragma_failure_count
+                    if scan_error:
+                        self.__handle_scan_worker_error(next_file, scan_error)
+            finally:
+                # Cancel any files that are still waiting to be scanned, so that
+                # leaving the with block only waits for the files being scanned.
+                for next_future in scan_futures.values():
+                    next_future.cancel()
+
+    def __handle_scan_worker_error(
+        self, next_file: str, scan_error: ScanWorkerError
+    ) -> None:
+        """
+        Report an error raised by a worker process in the same manner as if it had
+        been raised while scanning the file in this process.  Note that any stack
+        trace is the one captured in the worker process.
+        """
+        if scan_error.scan_error_type:
+            try:
+                raise scan_error.scan_error_type(
+                    formatted_message=scan_error.error_message
+                )
+            except (BadPluginError, BadTokenizationError) as this_exception:
+                self.__handle_scan_error(
+                    next_file,
+                    this_exception,
+                    formatted_stack_trace=scan_error.formatted_stack_trace,
+                )
+        else:
+            self.__handle_error(
+                scan_error.error_message,
+                None,
+                formatted_stack_trace=scan_error.formatted_stack_trace,
+            )
+
+    # pylint: disable=protected-access, broad-exception-caught
+    @staticmethod
+    def _initialize_scan_worker(direct_args: List[str]) -> None:
+        """
+        Initialize the instance used by a worker process to scan files.
+        """
+        worker_presentation = RecordingPresentation()
+        scan_worker = PyMarkdownLint(
+            presentation=worker_presentation, inherit_logging=True
+        )
+        worker_args = scan_worker.__initialize_subsystems(direct_args)
+        scan_worker.__initialize_parser(worker_args)
+        worker_presentation.take_recorded_calls()
+        PyMarkdownLint.__scan_worker = scan_worker
+        PyMarkdownLint.__scan_worker_args = worker_args
+
+    @staticmethod
+    def _scan_file_in_worker(
+        next_file: str,
+    ) -> Tuple[List[Tuple[str, Tuple[Any, ...]]], int, int, Optional[ScanWorkerError]]:
+        """
+        Scan a single file within a worker process, returning the recorded output,
+        the number of scan and pragma failures, and any error raised by the scan.
+        """
+        scan_worker, worker_args = (
+            PyMarkdownLint.__scan_worker,
+            PyMarkdownLint.__scan_worker_args,
+        )
+        assert scan_worker and worker_args
+        worker_plugins = scan_worker.__plugins
+        scan_failures_before, pragma_failures_before = (
+            worker_plugins.number_of_scan_failures,
+            worker_plugins.number_of_pragma_failures,
+        )
+
+        scan_error: Optional[ScanWorkerError] = None
+        try:
+            scan_worker.__scan_file(worker_args, next_file, next_file)
+        except (BadPluginError, BadTokenizationError) as this_exception:
+            scan_error = ScanWorkerError(
+                type(this_exception), str(this_exception), traceback.format_exc()
+            )
+        except Exception as this_exception:
+            scan_error = ScanWorkerError(
+                None,
+                PyMarkdownLint.__format_unexpected_error(this_exception),
+                ""
+                if isinstance(this_exception, ValueError)
+                else traceback.format_exc(),
+            )
+
+        worker_presentation = cast(RecordingPresentation, scan_worker.__presentation)
+        return (
+            worker_presentation.take_recorded_calls(),
+            worker_plugins.number_of_scan_failures - scan_failures_before,
+            worker_plugins.number_of_pragma_failures - pragma_failures_before,
+            scan_error,
+        )
+
+    # pylint: enable=protected-access, broad-exception-caught
+
     def __initialize_subsystems(
         self, direct_args: Optional[List[str]]
     ) -> argparse.Namespace:
+        self.__direct_args = sys.argv[1:] if direct_args is None else direct_args
         args = self.__parse_arguments(direct_args=direct_args)
         self.__set_initial_state(args)
 
@@ -417,15 +626,10 @@ class PyMarkdownLint:
 
     def __initialize_plugins(self, args: argparse.Namespace) -> None:
         try:
-            plugin_dir = os.path.dirname(os.path.realpath(__file__))
-            plugin_dir = os.path.join(plugin_dir, "plugins")
-            self.__initialize_plugin_manager(args, plugin_dir)
+            self.__initialize_plugin_manager(args, PyMarkdownLint.__plugin_directory)
             self.__apply_configuration_to_plugins()
         except ValueError as this_exception:
-            formatted_error = (
-                f"{type(this_exception).__name__} encountered while initializing plugins:\n"
-                + f"{this_exception}"
-            )
+            formatted_error = f"{type(this_exception).__name__} encountered while initializing plugins:\n{this_exception}"
             self.__handle_error(formatted_error, this_exception)
 
     # pylint: disable=broad-exception-caught
@@ -438,16 +642,10 @@ class PyMarkdownLint:
             self.__extensions.apply_configuration()
 
         except ValueError as this_exception:
-            formatted_error = (
-                f"Configuration error {type(this_exception).__name__} encountered "
-                + f"while initializing extensions:\n{this_exception}"
-            )
+            formatted_error = f"Configuration error {type(this_exception).__name__} encountered while initializing extensions:\n{this_exception}"
             self.__handle_error(formatted_error, this_exception)
         except Exception as this_exception:
-            formatted_error = (
-                f"Error {type(this_exception).__name__} encountered while initializing extensions:\n"
-                + f"{this_exception}"
-            )
+            formatted_error = f"Error {type(this_exception).__name__} encountered while initializing extensions:\n{this_exception}"
             self.__handle_error(formatted_error, this_exception)
 
     # pylint: enable=broad-exception-caught
@@ -489,13 +687,8 @@ class PyMarkdownLint:
                 POGGER.info("Processing files with parser.")
                 self.__process_files_to_scan(args, use_standard_in, files_to_scan)
                 POGGER.info("Files have been processed.")
-        except ValueError as this_exception:
-            formatted_error = f"Configuration Error: {this_exception}"
-            self.__handle_error(formatted_error, this_exception)
         except Exception as this_exception:
-            formatted_error = (
-                f"Unexpected Error({type(this_exception).__name__}): {this_exception}"
-            )
+            formatted_error = PyMarkdownLint.__format_unexpected_error(this_exception)
             self.__handle_error(formatted_error, this_exception)
         finally:
             if self.__logging:
@@ -64,6 +64,8 @@ class ParserLogger:
         """
         Determine whether debug logging is currently enabled.
         """
+        if ParserLogger.__global_count != self.__local_count:
+            self.__reset_cache()
         return self.__is_debug_enabled
 
     def debug(self, log_format: str, *args: Any) -> None:
@@ -0,0 +1,63 @@
+"""
+Module to provide for a presentation that records output instead of displaying it.
+"""
+from typing import Any, List, Tuple
+
+from pymarkdown.main_presentation import MainPresentation
+from pymarkdown.plugin_manager.plugin_scan_failure import PluginScanFailure
+
+
+class RecordingPresentation(MainPresentation):
+    """
+    Class to provide for a presentation that records output instead of displaying it,
+    allowing the output to be replayed later against another presentation.
+    """
+
+    def __init__(self) -> None:
+        self.__recorded_calls: List[Tuple[str, Tuple[Any, ...]]] = []
+
+    def print_system_output(self, output_string: str) -> None:
+        """
+        Record that output to standard out was requested.
+        """
+        self.__recorded_calls.append(("print_system_output", (output_string,)))
+
+    def print_system_error(self, error_string: str) -> None:
+        """
+        Record that output to standard error was requested.
+        """
+        self.__recorded_calls.append(("print_system_error", (error_string,)))
+
+    def print_pragma_failure(
+        self, scan_file: str, line_number: int, pragma_error: str
+    ) -> None:
+        """
+        Record a failure to compile the pragma.
+        """
+        self.__recorded_calls.append(
+            ("print_pragma_failure", (scan_file, line_number, pragma_error))
+        )
+
+    def print_scan_failure(self, scan_failure: PluginScanFailure) -> None:
+        """
+        Record a scan failure for a specific file and location.
+        """
+        self.__recorded_calls.append(("print_scan_failure", (scan_failure,)))
+
+    def take_recorded_calls(self) -> List[Tuple[str, Tuple[Any, ...]]]:
+        """
+        Return the calls recorded so far, and start recording anew.
+        """
+        recorded_calls, self.__recorded_calls = self.__recorded_calls, []
+        return recorded_calls
+
+    @staticmethod
+    def replay_recorded_calls(
+        recorded_calls: List[Tuple[str, Tuple[Any, ...]]],
+        presentation: MainPresentation,
+    ) -> None:
+        """
+        Replay the recorded calls, in order, against the supplied presentation.
+        """
+        for function_name, function_arguments in recorded_calls:
+            getattr(presentation, function_name)(*function_arguments)
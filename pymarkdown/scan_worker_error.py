@@ -0,0 +1,24 @@
+"""
+Module to contain information about an error raised while scanning a file in a worker process.
+"""
+from dataclasses import dataclass
+from typing import Optional, Type, Union
+
+from pymarkdown.bad_tokenization_error import BadTokenizationError
+from pymarkdown.plugin_manager.bad_plugin_error import BadPluginError
+
+
+@dataclass(frozen=True)
+class ScanWorkerError:
+    """
+    Class to contain information about an error raised while scanning a file in a
+    worker process.
+
+    If the error is one of the scan errors, `scan_error_type` is set and the error is
+    rebuilt from `error_message` by the main process so that it can be formatted by
+    the presentation.  Otherwise, `error_message` is the fully formatted error.
+    """
+
+    scan_error_type: Optional[Type[Union[BadPluginError, BadTokenizationError]]]
+    error_message: str
+    formatted_stack_trace: str
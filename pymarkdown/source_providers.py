@@ -26,6 +26,13 @@ class SourceProvider(ABC):
         Get the next line from the source provider.
         """
 
+    @abstractmethod
+    def is_text_in_remaining_lines(self, text_to_find: str) -> bool:
+        """
+        Whether the text, which must not contain a newline, occurs within any
+        of the lines that have not yet been provided.
+        """
+
 
 class InMemorySourceProvider(SourceProvider):
     """
@@ -59,6 +66,16 @@ class InMemorySourceProvider(SourceProvider):
                 self.__next_line_tuple = []
         return token_to_use
 
+    def is_text_in_remaining_lines(self, text_to_find: str) -> bool:
+        """
+        Whether the text, which must not contain a newline, occurs within any
+        of the lines that have not yet been provided.
+        """
+        return any(
+            text_to_find in next_remaining_text
+            for next_remaining_text in self.__next_line_tuple
+        )
+
 
 class FileSourceProvider(SourceProvider):
     """
@@ -67,17 +84,10 @@ class FileSourceProvider(SourceProvider):
 
     def __init__(self, file_to_open: str) -> None:
         with open(file_to_open, encoding="utf-8") as file_to_parse:
-            file_as_lines = file_to_parse.readlines()
-
-        self.read_lines, self.read_index, did_line_end_in_newline = [], 0, True
-        for next_line in file_as_lines:
-            did_line_end_in_newline = next_line.endswith(ParserHelper.newline_character)
-            if did_line_end_in_newline:
-                next_line = next_line[:-1]
-            self.read_lines.append(next_line)
+            file_as_text = file_to_parse.read()
 
-        if did_line_end_in_newline:
-            self.read_lines.append("")
+        self.read_lines: List[str] = file_as_text.split(ParserHelper.newline_character)
+        self.read_index = 0
 
     def is_at_end_of_file(self) -> bool:
         """
@@ -94,3 +104,13 @@ class FileSourceProvider(SourceProvider):
             token_to_use = self.read_lines[self.read_index]
             self.read_index += 1
         return token_to_use
+
+    def is_text_in_remaining_lines(self, text_to_find: str) -> bool:
+        """
+        Whether the text, which must not contain a newline, occurs within any
+        of the lines that have not yet been provided.
+        """
+        return any(
+            text_to_find in next_line
+            for next_line in self.read_lines[self.read_index :]
+        )
@@ -21,7 +21,7 @@ from pymarkdown.container_markdown_token import (
 )
 from pymarkdown.extension_manager.extension_manager import ExtensionManager
 from pymarkdown.extensions.front_matter_extension import FrontMatterExtension
-from pymarkdown.extensions.pragma_token import PragmaToken
+from pymarkdown.extensions.pragma_token import PragmaExtension, PragmaToken
 from pymarkdown.html.html_helper import HtmlHelper
 from pymarkdown.inline.inline_character_reference_helper import (
     InlineCharacterReferenceHelper,
@@ -144,7 +144,9 @@ class TokenizedMarkdown:
         assert self.__source_provider is not None
         self.__token_stack = [DocumentStackToken()]
         self.__tokenized_document = []
-        self.__parse_properties.pragma_lines = {}
+        self.__parse_properties.reset_for_new_document(
+            PragmaExtension.may_contain_pragmas(self.__source_provider)
+        )
 
         POGGER.debug("---")
         try:
@@ -207,3 +207,50 @@ def test_source_provider_file_two_lines_with_blank_between_and_trailing():
     __verify_line(expected_third_line, actual_third_line)
     __verify_line(expected_fourth_line, actual_fourth_line)
     __verify_line(expected_fifth_line, actual_fifth_line)
+
+
+def test_source_provider_in_memory_text_in_remaining_lines():
+    """
+    Test the in memory source provider's search for text in the remaining lines.
+    """
+
+    # Arrange
+    source_provider = InMemorySourceProvider(
+        "this is the first line\n<!-- comment -->\nthis is the third line"
+    )
+
+    # Act
+    is_found_before_reading = source_provider.is_text_in_remaining_lines("<!--")
+    source_provider.get_next_line()
+    source_provider.get_next_line()
+    is_found_after_reading = source_provider.is_text_in_remaining_lines("<!--")
+    is_other_text_found = source_provider.is_text_in_remaining_lines("third")
+
+    # Assert
+    assert is_found_before_reading
+    assert not is_found_after_reading
+    assert is_other_text_found
+
+
+def test_source_provider_file_text_in_remaining_lines():
+    """
+    Test the file source provider's search for text in the remaining lines.
+    """
+
+    # Arrange
+    resource_directory = os.path.join(os.getcwd(), "test", "resources")
+    input_file = os.path.join(resource_directory, "double-line.txt")
+    source_provider = FileSourceProvider(input_file)
+
+    # Act
+    is_first_found_before_reading = source_provider.is_text_in_remaining_lines("first")
+    is_missing_text_found = source_provider.is_text_in_remaining_lines("<!--")
+    source_provider.get_next_line()
+    is_first_found_after_reading = source_provider.is_text_in_remaining_lines("first")
+    is_second_found_after_reading = source_provider.is_text_in_remaining_lines("second")
+
+    # Assert
+    assert is_first_found_before_reading
+    assert not is_missing_text_found
+    assert not is_first_found_after_reading
+    assert is_second_found_after_reading
@@ -2,7 +2,9 @@
 Module to provide tests related to the "-l" option.
 """
 import os
+import tempfile
 from test.markdown_scanner import MarkdownScanner
+from unittest.mock import patch
 
 
 def test_markdown_with_dash_h():
@@ -15,7 +17,8 @@ def test_markdown_with_dash_h():
     supplied_arguments = ["scan", "-h"]
 
     expected_return_code = 0
-    expected_output = """usage: main.py scan [-h] [-l] [-r] [-ae ALTERNATE_EXTENSIONS] path [path ...]
+    expected_output = """usage: main.py scan [-h] [-l] [-r] [-ae ALTERNATE_EXTENSIONS] [-j JOBS]
+                    path [path ...]
 
 positional arguments:
   path                  one or more paths to scan for eligible Markdown files
@@ -27,6 +30,8 @@ optional arguments:
   -ae ALTERNATE_EXTENSIONS, --alternate-extensions ALTERNATE_EXTENSIONS
                         provide an alternate set of file extensions to scan
                         for
+  -j JOBS, --jobs JOBS  number of processes to use when scanning files
+                        (default is 1)
 """
     expected_error = ""
 
@@ -50,7 +55,8 @@ def test_markdown_with_dash_l_only():
 
     expected_return_code = 2
     expected_output = ""
-    expected_error = """usage: main.py scan [-h] [-l] [-r] [-ae ALTERNATE_EXTENSIONS] path [path ...]
+    expected_error = """usage: main.py scan [-h] [-l] [-r] [-ae ALTERNATE_EXTENSIONS] [-j JOBS]
+                    path [path ...]
 main.py scan: error: the following arguments are required: path
 """
 
@@ -463,3 +469,77 @@ def test_markdown_with_dash_l_and_dash_r_on_directory():
     execute_results.assert_results(
         expected_output, expected_error, expected_return_code
     )
+
+
+def test_markdown_with_dash_l_and_dash_r_on_directory_with_unreadable_subdirectory():
+    """
+    Test to make sure that a subdirectory that cannot be listed is skipped,
+    in the same way that os.walk skips it, instead of stopping the scan.
+    """
+
+    # Arrange
+    scanner = MarkdownScanner()
+    with tempfile.TemporaryDirectory() as tmp_dir_path:
+        readable_file_path = os.path.join(tmp_dir_path, "ok.md")
+        with open(readable_file_path, "wt", encoding="utf-8") as outfile:
+            outfile.write("# Heading\n")
+        locked_directory_path = os.path.join(tmp_dir_path, "locked")
+        os.mkdir(locked_directory_path)
+        with open(
+            os.path.join(locked_directory_path, "hidden.md"), "wt", encoding="utf-8"
+        ) as outfile:
+            outfile.write("# Heading\n")
+        supplied_arguments = ["scan", "-l", "-r", tmp_dir_path]
+
+        expected_return_code = 0
+        expected_output = f"{readable_file_path}\n"
+        expected_error = ""
+
+        original_scandir = os.scandir
+
+        def scandir_with_locked_directory(path):
+            if path == locked_directory_path:
+                raise PermissionError(13, "Permission denied", path)
+            return original_scandir(path)
+
+        # Act
+        with patch("os.scandir", side_effect=scandir_with_locked_directory):
+            execute_results = scanner.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    execute_results.assert_results(
+        expected_output, expected_error, expected_return_code
+    )
+
+
+def test_markdown_with_dash_l_on_unreadable_directory():
+    """
+    Test to make sure that a directory that cannot be listed is treated as
+    a directory without any eligible files, instead of stopping the scan.
+    """
+
+    # Arrange
+    scanner = MarkdownScanner()
+    with tempfile.TemporaryDirectory() as tmp_dir_path:
+        supplied_arguments = ["scan", "-l", tmp_dir_path]
+
+        expected_return_code = 1
+        expected_output = ""
+        expected_error = """No matching files found.
+"""
+
+        original_scandir = os.scandir
+
+        def scandir_with_locked_directory(path):
+            if path == tmp_dir_path:
+                raise PermissionError(13, "Permission denied", path)
+            return original_scandir(path)
+
+        # Act
+        with patch("os.scandir", side_effect=scandir_with_locked_directory):
+            execute_results = scanner.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    execute_results.assert_results(
+        expected_output, expected_error, expected_return_code
+    )
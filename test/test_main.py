@@ -4,7 +4,10 @@ Module to provide tests related to the basic parts of the scanner.
 import logging
 import os
 import runpy
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from test.markdown_scanner import MarkdownScanner
+from unittest.mock import patch
 
 from pymarkdown.parser_logger import ParserLogger
 
@@ -410,6 +413,196 @@ def test_markdown_with_dash_x_init():
     )
 
 
+def test_markdown_with_dash_j_scans_in_parallel():
+    """
+    Test to make sure that scanning with multiple jobs reports the same
+    failures, in the same order, as a serial scan.
+    """
+
+    # Arrange
+    scanner = MarkdownScanner()
+    source_path = os.path.join("test", "resources", "rules", "md047")
+    supplied_arguments = [
+        "scan",
+        "-j",
+        "2",
+        source_path,
+    ]
+
+    expected_return_code = 1
+    expected_output = (
+        f"{os.path.join(source_path, 'end_with_no_blank_line.md')}:3:41: "
+        + "MD047: Each file should end with a single newline character. (single-trailing-newline)\n"
+        + f"{os.path.join(source_path, 'end_with_no_blank_line_and_spaces.md')}:4:2: "
+        + "MD047: Each file should end with a single newline character. (single-trailing-newline)\n"
+    )
+    expected_error = ""
+
+    # Act
+    execute_results = scanner.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    execute_results.assert_results(
+        expected_output, expected_error, expected_return_code
+    )
+
+
+def test_markdown_with_dash_j_and_dash_x_scan():
+    """
+    Test to make sure that a scan exception raised within a worker process
+    is reported the same way as it is for a serial scan.
+    """
+
+    # Arrange
+    scanner = MarkdownScanner()
+    source_path = os.path.join("test", "resources", "rules", "md047")
+    supplied_arguments = [
+        "-x-scan",
+        "scan",
+        "--jobs",
+        "2",
+        source_path,
+    ]
+
+    expected_return_code = 1
+    expected_output = ""
+    expected_error = """BadTokenizationError encountered while scanning '{source_path}':
+An unhandled error occurred processing the document.
+""".replace(
+        "{source_path}", os.path.join(source_path, "empty.md")
+    )
+
+    # Act
+    execute_results = scanner.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    execute_results.assert_results(
+        expected_output, expected_error, expected_return_code
+    )
+
+
+def test_markdown_with_dash_j_and_unexpected_error():
+    """
+    Test to make sure that an error other than a scan exception raised within a
+    worker process is reported the same way as it is for a serial scan, after
+    the failures for any file scanned before it.
+    """
+
+    # Arrange
+    scanner = MarkdownScanner()
+    with tempfile.TemporaryDirectory() as tmp_dir_path:
+        first_file_path = os.path.join(tmp_dir_path, "first.md")
+        with open(first_file_path, "wt", encoding="utf-8") as outfile:
+            outfile.write("Some text")
+        with open(os.path.join(tmp_dir_path, "second.md"), "wb") as outfile:
+            outfile.write(b"\xff\xfe# Heading\n")
+        with open(
+            os.path.join(tmp_dir_path, "third.md"), "wt", encoding="utf-8"
+        ) as outfile:
+            outfile.write("Some text")
+        supplied_arguments = [
+            "scan",
+            "-j",
+            "2",
+            tmp_dir_path,
+        ]
+
+        expected_return_code = 1
+        expected_output = (
+            f"{first_file_path}:1:9: "
+            + "MD047: Each file should end with a single newline character. (single-trailing-newline)\n"
+        )
+        expected_error = """
+
+Configuration Error: 'utf-8' codec can't decode byte 0xff in position 0: invalid start byte
+"""
+
+        # Act
+        execute_results = scanner.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    execute_results.assert_results(
+        expected_output, expected_error, expected_return_code
+    )
+
+
+def test_markdown_with_dash_j_above_windows_maximum():
+    """
+    Test to make sure that, on Windows, the number of worker processes is capped
+    at the maximum number that ProcessPoolExecutor allows on that platform.
+    """
+
+    # Arrange
+    scanner = MarkdownScanner()
+    with tempfile.TemporaryDirectory() as tmp_dir_path:
+        for file_index in range(62):
+            with open(
+                os.path.join(tmp_dir_path, f"file{file_index}.md"),
+                "wt",
+                encoding="utf-8",
+            ) as outfile:
+                outfile.write("Some text\n")
+        supplied_arguments = [
+            "scan",
+            "-j",
+            "100",
+            tmp_dir_path,
+        ]
+
+        expected_return_code = 0
+        expected_output = ""
+        expected_error = ""
+
+        requested_max_workers = []
+
+        def create_executor(max_workers, **kwargs):
+            requested_max_workers.append(max_workers)
+            return ProcessPoolExecutor(max_workers=2, **kwargs)
+
+        # Act
+        with patch("sys.platform", "win32"), patch(
+            "pymarkdown.main.ProcessPoolExecutor", side_effect=create_executor
+        ):
+            execute_results = scanner.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    execute_results.assert_results(
+        expected_output, expected_error, expected_return_code
+    )
+    assert requested_max_workers == [61]
+
+
+def test_markdown_with_dash_j_not_positive():
+    """
+    Test to make sure that the number of jobs must be a positive integer.
+    """
+
+    # Arrange
+    scanner = MarkdownScanner()
+    source_path = os.path.join("test", "resources", "rules", "md047")
+    supplied_arguments = [
+        "scan",
+        "-j",
+        "0",
+        source_path,
+    ]
+
+    expected_return_code = 2
+    expected_output = ""
+    expected_error = """usage: main.py scan [-h] [-l] [-r] [-ae ALTERNATE_EXTENSIONS] [-j JOBS]
+                    path [path ...]
+main.py scan: error: argument -j/--jobs: Value '0' is not a positive integer.
+"""
+
+    # Act
+    execute_results = scanner.invoke_main(arguments=supplied_arguments)
+
+    # Assert
+    execute_results.assert_results(
+        expected_output, expected_error, expected_return_code
+    )
+
+
 # TODO add Markdown parsing of some binary file to cause the tokenizer to throw an exception?
 
 
@@ -381,6 +381,33 @@ def test_markdown_logger_arg_list_not_out_of_sync_with_debug():
     new_logger.debug_with_visible_whitespace("one sub $ and one in list", " 1 ")
 
 
+def test_markdown_logger_is_debug_enabled_after_sync():
+    """
+    Test to make sure that the cached debug flag is refreshed after the
+    logger is told to sync on its next call.
+    """
+
+    # Arrange
+    root_logger = logging.getLogger()
+    original_level = root_logger.level
+    try:
+        root_logger.setLevel(logging.WARNING)
+        ParserLogger.sync_on_next_call()
+        new_logger = ParserLogger(logging.getLogger(__name__))
+        assert not new_logger.is_debug_enabled
+        root_logger.setLevel(logging.DEBUG)
+
+        # Act
+        ParserLogger.sync_on_next_call()
+        is_debug_enabled = new_logger.is_debug_enabled
+
+        # Assert
+        assert is_debug_enabled
+    finally:
+        root_logger.setLevel(original_level)
+        ParserLogger.sync_on_next_call()
+
+
 # pylint: disable=broad-exception-caught
 def test_markdown_logger_arg_list_out_of_sync():
     """
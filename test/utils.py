@@ -105,53 +105,78 @@ def write_temporary_configuration(
 def assert_if_lists_different(expected_tokens, actual_tokens):
     """
     Compare two lists and make sure they are equal, asserting if not.
+
+    Note that the details of any differences are only computed if the
+    assert fails, keeping the common case of equal lists fast.
     """
 
-    print("\n---")
-    print(f"expected_tokens: {ParserHelper.make_value_visible(expected_tokens)}")
-    print(f"parsed_tokens  : {ParserHelper.make_value_visible(actual_tokens)}")
     assert len(expected_tokens) == len(
         actual_tokens
-    ), f"List lengths are not the same: ({len(expected_tokens)}) vs ({len(actual_tokens)})"
-    print("---")
+    ), f"List lengths are not the same: ({len(expected_tokens)}) vs ({len(actual_tokens)})\n{__format_list_difference(expected_tokens, actual_tokens)}"
 
     for element_index, next_expected_token in enumerate(expected_tokens):
         expected_str = str(next_expected_token)
         actual_str = str(actual_tokens[element_index])
 
-        print(
-            f"expected_tokens({len(expected_str)})>>{ParserHelper.make_value_visible(expected_str)}<<"
-        )
-        print(
-            f"actual_tokens  ({len(actual_str)})>>{ParserHelper.make_value_visible(actual_str)}<<"
+        assert expected_str == actual_str, (
+            f"List items {element_index} are not equal."
+            + __format_values("tokens", expected_str, actual_str)
+            + __format_list_difference(expected_tokens, actual_tokens)
         )
 
-        diff = difflib.ndiff(expected_str, actual_str)
 
-        diff_values = f"{ParserHelper.newline_character.join(list(diff))}\n---\n"
+def assert_if_strings_different(expected_string, actual_string):
+    """
+    Compare two strings and make sure they are equal, asserting if not.
+    """
 
-        assert expected_str == str(
-            actual_tokens[element_index]
-        ), f"List items {element_index} are not equal.{diff_values}"
-    print("---\nLists are equal.\n---")
+    assert expected_string == actual_string, (
+        "Strings are not equal."
+        + __format_values("string", expected_string, actual_string)
+        + __format_line_difference(
+            expected_string.split(ParserHelper.newline_character),
+            actual_string.split(ParserHelper.newline_character),
+        )
+    )
 
 
-def assert_if_strings_different(expected_string, actual_string):
+def __format_values(value_name, expected_value, actual_value):
     """
-    Compare two strings and make sure they are equal, asserting if not.
+    Format the expected and actual values for an assert message.
     """
 
-    print(f"expected_string({len(expected_string)})>>{expected_string}<<")
-    print(f"expected_string>>{ParserHelper.make_value_visible(expected_string)}<<")
+    return (
+        f"\nexpected_{value_name}({len(expected_value)})>>{ParserHelper.make_value_visible(expected_value)}<<"
+        + f"\nactual_{value_name}  ({len(actual_value)})>>{ParserHelper.make_value_visible(actual_value)}<<\n"
+    )
 
-    print(f"actual_string  ({len(actual_string)})>>{actual_string}<<")
-    print(f"actual_string  >>{ParserHelper.make_value_visible(actual_string)}<<")
 
-    diff = difflib.ndiff(expected_string, actual_string)
+def __format_list_difference(expected_tokens, actual_tokens):
+    """
+    Format the difference between two lists of tokens, one token per line.
+    """
+
+    return __format_line_difference(
+        [
+            ParserHelper.make_value_visible(str(next_token))
+            for next_token in expected_tokens
+        ],
+        [
+            ParserHelper.make_value_visible(str(next_token))
+            for next_token in actual_tokens
+        ],
+    )
 
-    diff_values = f"{ParserHelper.newline_character.join(list(diff))}\n---\n"
 
-    assert expected_string == actual_string, f"Strings are not equal.{diff_values}"
+def __format_line_difference(expected_lines, actual_lines):
+    """
+    Format the difference between two lists of lines as a unified diff.
+    """
+
+    diff = difflib.unified_diff(
+        expected_lines, actual_lines, fromfile="expected", tofile="actual", lineterm=""
+    )
+    return f"{ParserHelper.newline_character.join(diff)}\n---\n"
 
 
 def __assert_token_consistency(